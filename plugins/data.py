@@ -1,6 +1,5 @@
 import os
 import json
-import yaml
 
 
 class Data:
@@ -22,10 +21,14 @@ class Data:
 
 		if file_path is not None:
 			if ext == 'json':
-				with open(file_path, 'r', encoding='utf-8') as file:
+				with open(file_path, 'rb') as file:
 					value = json.load(file)
 			else:
-				with open(file_path, 'r', encoding='utf-8') as file:
-					value = yaml.safe_load(file)
+				import yaml  # Heavy import, paid only when YAML is actually read
+
+				loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+				with open(file_path, 'rb') as file:
+					value = yaml.load(file, Loader=loader)
 
 		return value
\ No newline at end of file
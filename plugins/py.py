@@ -1,8 +1,21 @@
+import functools
 import os
 
 import wl
 
 
+# Memoized name conversions, keyed by the library's String class
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def camel_to_snake(string, name):
+	return string.camel_to_snake(name)
+
+
+@functools.lru_cache(maxsize=4096)
+def snake_to_camel(string, name):
+	return string.snake_to_camel(name)
+
+
 class Py(wl.Plugin):
 
 	EXTENSIONS = ['py']
@@ -14,17 +27,19 @@ class Py(wl.Plugin):
 		class_name = None
 		route      = None
 
+		stem, suffix = os.path.splitext(name)
+
 		# bar.py /mypath/foo wl
 		# - - - - - - - - - - - - - - - - - - - - 
 		try_path = os.path.join(parent_path, name)
-		if os.path.isfile(try_path):
-			class_name = self.lib.String.snake_to_camel(os.path.splitext(name)[0])
+		if suffix[1:] in self.EXTENSIONS and os.path.isfile(try_path):
+			class_name = snake_to_camel(self.lib.String, stem)
 			path       = try_path
 
 		# Bar /mypath/foo wl
 		# - - - - - - - - - - - - - - - - - - - - 
 		else:
-			module_name = self.lib.String.camel_to_snake(name)
+			module_name = camel_to_snake(self.lib.String, name)
 			for ext in self.EXTENSIONS:
 				try_path = os.path.join(parent_path, f'{module_name}.{ext}')
 				if os.path.isfile(try_path):
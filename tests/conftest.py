@@ -0,0 +1,45 @@
+import sys
+
+import pytest
+
+
+# Published library instance
+# ----------------------------------------------------------------------
+# wl.py imports lib/, which ships with the full tree and is put on the
+# path by the editable install in install.sh; `pip install -e .[test]`
+# also brings pytest. Without lib/ every test skips.
+@pytest.fixture
+def wl():
+	return pytest.importorskip('wl')
+
+
+# Library factory over a temporary root
+# ----------------------------------------------------------------------
+@pytest.fixture
+def make_lib(wl, tmp_path):
+	lib = type(wl)
+
+	def make(**kwargs):
+		class Probe(wl.WL, path=str(tmp_path), **kwargs):
+			pass
+		return Probe.__instance__
+
+	yield make
+
+	# WLMeta points these globals at the newest library; restore them
+	lib.Undefined.lib   = lib
+	lib.Imports.__lib__ = wl
+	lib.Tester.lib      = wl
+	sys.modules.pop('probe', None)
+	globals().pop('probe', None)  # WLMeta publishes into the defining module
+
+
+# Write a Module carrier source file
+# ----------------------------------------------------------------------
+@pytest.fixture
+def write_module(tmp_path):
+	def write(file_name, class_name):
+		path = tmp_path / file_name
+		path.write_text(f'import wl\n\n\nclass {class_name}(wl.Module):\n\tpass\n')
+		return str(path)
+	return write
@@ -0,0 +1,23 @@
+def test_invalidate_releases_cached_miss(make_lib, write_module):
+	lib = make_lib(misses=True)
+
+	assert not hasattr(lib, 'Bar')
+
+	write_module('bar.py', 'Bar')
+	lib.invalidate()
+
+	assert lib.Bar.__name__ == 'Bar'
+
+
+def test_invalidate_drops_cached_children(make_lib, write_module):
+	lib  = make_lib()
+	face = type(lib).__instance__
+	write_module('bar.py', 'Bar')
+
+	lib.Bar
+	carrier = face.__children__['Bar']
+	lib.invalidate()
+
+	assert face.__children__ == {}
+	lib.Bar
+	assert face.__children__['Bar'] is not carrier
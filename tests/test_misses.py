@@ -0,0 +1,57 @@
+import shutil
+
+import pytest
+
+
+def test_miss_resolves_once_file_is_added(make_lib, write_module):
+	lib = make_lib()
+
+	assert not hasattr(lib, 'Bar')
+
+	write_module('bar.py', 'Bar')
+
+	assert lib.Bar.__name__ == 'Bar'
+
+
+def test_cached_miss_holds_when_opted_in(make_lib, write_module):
+	lib = make_lib(misses=True)
+
+	assert not hasattr(lib, 'Bar')
+
+	write_module('bar.py', 'Bar')
+
+	assert not hasattr(lib, 'Bar')
+	assert 'Bar' in type(lib).__instance__.__misses__
+
+
+def test_miss_is_not_cached_by_default(make_lib):
+	lib = make_lib()
+
+	assert not hasattr(lib, 'Bar')
+	assert type(lib).__instance__.__misses__ == set()
+
+
+@pytest.mark.parametrize('misses', [False, True])
+def test_missing_face_directory_raises_attribute_error(make_lib, tmp_path, misses):
+	lib = make_lib(misses=misses)
+	shutil.rmtree(tmp_path)
+
+	assert getattr(lib, 'Bar', None) is None
+
+
+def test_dunder_probe_is_not_recorded(make_lib):
+	lib = make_lib(misses=True)
+
+	assert not hasattr(lib, '__wrapped__')
+	assert type(lib).__instance__.__misses__ == set()
+
+
+def test_link_releases_cached_miss(make_lib, tmp_path_factory):
+	lib    = make_lib(misses=True)
+	source = tmp_path_factory.mktemp('source')
+
+	assert not hasattr(lib, 'ext')
+
+	lib.link('ext', str(source))
+
+	assert hasattr(lib, 'ext')
@@ -0,0 +1,35 @@
+import types
+
+
+def carrier(data):
+	return types.SimpleNamespace(load=lambda: data)
+
+
+def plugin(names, data):
+	return lambda name, parent_path, parent_route: carrier(data) if name in names else None
+
+
+def test_first_registered_plugin_wins(make_lib):
+	lib     = make_lib()
+	plugins = type(lib).__PLUGINS__
+	plugins['First']  = plugin({'bar.py'}, 'first')
+	plugins['Second'] = plugin({'bar.py'}, 'second')
+
+	assert getattr(lib, 'bar.py') == 'first'
+
+
+def test_dotted_name_falls_through_to_next_plugin(make_lib):
+	lib     = make_lib()
+	plugins = type(lib).__PLUGINS__
+	plugins['Never'] = plugin(set(), 'never')
+	plugins['Data']  = plugin({'config.py'}, 'data')
+
+	assert getattr(lib, 'config.py') == 'data'
+
+
+def test_bare_name_reaches_plugin_in_order(make_lib, write_module):
+	lib = make_lib()
+	write_module('bar.py', 'Bar')
+	type(lib).__PLUGINS__['Shadow'] = plugin({'Bar'}, 'shadow')
+
+	assert lib.Bar == 'shadow'
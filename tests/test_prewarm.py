@@ -0,0 +1,71 @@
+import threading
+import types
+
+import pytest
+
+
+class Carrier:
+
+	def __init__(self, data, barrier=None):
+		self.data    = data
+		self.barrier = barrier
+		self.loads   = 0
+		self.lock    = threading.Lock()
+
+	def load(self):
+		with self.lock:
+			self.loads += 1
+		if self.barrier is not None:
+			self.barrier.wait()  # Breaks unless loads overlap
+		return self.data
+
+
+@pytest.fixture
+def carriers(make_lib):
+	lib      = make_lib()
+	barrier  = threading.Barrier(2, timeout=5)
+	carriers = {
+		'Thing' : Carrier(types.SimpleNamespace(a=1, b=2)),
+		'Other' : Carrier(3),
+		'Left'  : Carrier(types.SimpleNamespace(x=4), barrier),
+		'Right' : Carrier(types.SimpleNamespace(x=5), barrier),
+	}
+	type(lib).__PLUGINS__['Fake'] = lambda name, parent_path, parent_route: carriers.get(name)
+	return lib, carriers
+
+
+def test_prewarm_returns_values_in_input_order(carriers):
+	lib, _ = carriers
+
+	assert lib.prewarm(['Other', 'Thing.b', 'Thing.a', 'Other']) == [3, 2, 1, 3]
+
+
+def test_prewarm_realizes_shared_head_once(carriers):
+	lib, carriers = carriers
+
+	lib.prewarm(['Thing.a', 'Thing.b', 'Thing.a', 'Thing'])
+
+	assert carriers['Thing'].loads == 1
+
+
+def test_prewarm_realizes_duplicate_name_once(carriers):
+	lib, carriers = carriers
+
+	lib.prewarm(['Other', 'Other', 'Other'])
+
+	assert carriers['Other'].loads == 1
+
+
+@pytest.mark.parametrize('names', [['Other', 'Nope'], ['Thing.nope'], ['Nope.a']])
+def test_prewarm_propagates_resolution_errors(carriers, names):
+	lib, _ = carriers
+
+	with pytest.raises(AttributeError):
+		lib.prewarm(names)
+
+
+def test_prewarm_realizes_dotted_heads_concurrently(carriers):
+	lib, carriers = carriers
+
+	assert lib.prewarm(['Left.x', 'Right.x']) == [4, 5]
+	assert carriers['Left'].loads == carriers['Right'].loads == 1
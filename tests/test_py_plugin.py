@@ -0,0 +1,39 @@
+import pytest
+
+
+@pytest.fixture
+def py(wl):
+	return type(wl).__PLUGINS__['Py']
+
+
+def test_resolves_class_name_to_snake_file(py, tmp_path, write_module):
+	path = write_module('foo_bar.py', 'FooBar')
+
+	assert py.__resolve__('FooBar', str(tmp_path), 'probe') == (path, 'FooBar', 'probe.FooBar')
+
+
+def test_resolves_file_name_to_camel_class(py, tmp_path, write_module):
+	path = write_module('foo_bar.py', 'FooBar')
+
+	assert py.__resolve__('foo_bar.py', str(tmp_path), 'probe') == (path, 'FooBar', 'probe.FooBar')
+
+
+def test_ignores_file_without_known_extension(py, tmp_path, write_module):
+	(tmp_path / 'Bar').write_text('not python')
+	path = write_module('bar.py', 'Bar')
+
+	assert py.__resolve__('Bar', str(tmp_path), 'probe') == (path, 'Bar', 'probe.Bar')
+
+
+def test_missing_name_resolves_to_nothing(py, tmp_path):
+	assert py.__resolve__('Nope', str(tmp_path), 'probe') == (None, None, None)
+
+
+def test_repeated_resolve_reuses_name_conversion(py, tmp_path):
+	camel_to_snake = py.__resolve__.__globals__['camel_to_snake']
+	camel_to_snake.cache_clear()
+
+	py.__resolve__('NoSuchName', str(tmp_path), 'probe')
+	py.__resolve__('NoSuchName', str(tmp_path), 'probe')
+
+	assert camel_to_snake.cache_info().hits == 1
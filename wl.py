@@ -16,8 +16,10 @@ from lib.tester    import Tester
 class WLMeta(type):
 
 	# Create class
+	# misses=True caches failed lookups per layer, so repeated misses skip
+	# the plugins; files created afterwards stay hidden until invalidate()
 	# ----------------------------------------------------------------------
-	def __new__(mcls, name, bases, namespace, path=None, plugins=None):
+	def __new__(mcls, name, bases, namespace, path=None, plugins=None, misses=False):
 		module_name  = namespace.get('__module__')
 		module       = sys.modules[module_name]
 		lib_file     = os.path.realpath(module.__file__)
@@ -36,6 +38,7 @@ class WLMeta(type):
 		instance.__name__  = name.lower()
 		instance.__spec__  = None
 		instance.__children__ = {}
+		instance.__misses__   = set()
 
 		Imports.__lib__ = instance
 		Tester.lib      = instance
@@ -49,6 +52,7 @@ class WLMeta(type):
 		cls.__lib_path__ = lib_path
 		cls.__instance__ = instance
 		cls.__PLUGINS__  = {}
+		cls.__MISSES__   = misses
 		cls.Tester       = Tester
 		cls.tester       = Tester
 
@@ -85,11 +89,20 @@ class WL(metaclass=WLMeta, plugins=['Py']): # , 'Data', 'Text'
 			if value is not None:
 				break
 
+			if name in instance.__misses__:
+				continue
+
 			value = instance.__resolve__(name, instance.__path__, self.__name__)
 			if value is not None:
-				instance.__children__[name] = value
+				value = instance.__children__.setdefault(name, value)
 				break
 
+			# Opt-in: plugins are not re-asked until invalidate(), so sources
+			# created after a miss stay hidden until then. Dunder probes
+			# (copy, inspect) are never recorded.
+			if instance.__MISSES__ and not name.startswith('__'):
+				instance.__misses__.add(name)
+
 		if value is None:
 			raise AttributeError(f'Library `{self.__name__}` has no attribute `{name}`')
 
@@ -116,15 +129,15 @@ class WL(metaclass=WLMeta, plugins=['Py']): # , 'Data', 'Text'
 	# ----------------------------------------------------------------------
 	def __resolve__(self, name, parent_path, parent_route):
 		value = None
-		path  = os.path.realpath(os.path.join(parent_path, name))
+		path  = os.path.join(parent_path, name)
 
 		if parent_path == self.__path__ and name in ['test', 'test.py']:
 			value = None
 		elif os.path.isdir(path):
-			return Directory(self, path, f'{parent_route}.{name}')
+			return Directory(self, os.path.realpath(path), f'{parent_route}.{name}')
 		else:
 			for instance in self.__instances__():
-				for plugin_name, plugin in instance.__PLUGINS__.items():
+				for plugin in instance.__PLUGINS__.values():
 					value = plugin(name, parent_path, parent_route)
 					if value is not None: break
 				if value is not None: break
@@ -144,3 +157,38 @@ class WL(metaclass=WLMeta, plugins=['Py']): # , 'Data', 'Text'
 	# ----------------------------------------------------------------------
 	def link(self, name, path):
 		Directory(self, self.__path__, self.__name__).link(name, path)
+		type(self).__instance__.__misses__.discard(name)
+
+	# Resolve dotted names concurrently to warm caches
+	# ----------------------------------------------------------------------
+	def prewarm(self, names):
+		from concurrent.futures import ThreadPoolExecutor
+
+		def resolve(name):
+			head, _, tail = name.rpartition('.')
+			return getattr(values[head] if head else self, tail)
+
+		# Names at one depth are distinct, so no carrier is realized by two
+		# threads; each level resolves from the parents realized before it
+		levels = {}
+		for name in names:
+			parts = name.split('.')
+			for depth in range(1, len(parts) + 1):
+				levels.setdefault(depth, {})['.'.join(parts[:depth])] = None
+
+		values = {}
+		with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+			for depth in sorted(levels):
+				level = list(levels[depth])
+				values.update(zip(level, list(executor.map(resolve, level))))
+
+		return [values[name] for name in names]
+
+	# Drop cached children and misses on every lineage layer
+	# Call after adding sources under a misses=True library; link() already
+	# releases its own name
+	# ----------------------------------------------------------------------
+	def invalidate(self):
+		for instance in self.__instances__():
+			instance.__children__.clear()
+			instance.__misses__.clear()